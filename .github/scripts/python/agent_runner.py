@@ -5,23 +5,95 @@ Agent runner for GitHub Actions.
 """
 
 import base64
-import json
+import contextlib
+import functools
+import importlib
+import importlib.util
 import os
 import sys
+from collections.abc import Callable
+from typing import Any
 
-from strands import Agent
-from strands.session import S3SessionManager
-from strands.telemetry import StrandsTelemetry
-from strands_tools.utils.models.model import create_model
+try:
+    import orjson as json_parser
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    import json as json_parser
 
 # Environment defaults
 os.environ.setdefault("BYPASS_TOOL_CONSENT", "true")
 os.environ.setdefault("STRANDS_TOOL_CONSOLE_MODE", "enabled")
 os.environ.setdefault("EDITOR_DISABLE_BACKUP", "true")
 
+# Packages already imported by load_tools, reused across calls
+_pkg_cache: dict = {}
+_MISSING = object()
+
+# Tool loading defaults (minimal core tools); parsed once into _DEFAULT_PARSED below _parse_tools_config
+_DEFAULT_TOOLS = (
+    "strands_tools:shell,retrieve,use_agent;strands_action:use_github,system_prompt,store_in_kb,create_subagent"
+)
+
+# Tool functions exported by github_tools.py, loaded by load_github_tools
+_GITHUB_TOOL_NAMES = (
+    "create_issue",
+    "update_issue",
+    "add_issue_comment",
+    "create_pull_request",
+    "update_pull_request",
+    "reply_to_review_comment",
+    "get_issue",
+    "list_issues",
+    "get_issue_comments",
+    "get_pull_request",
+    "list_pull_requests",
+    "get_pr_review_and_comments",
+)
+
+# Additional tools as (module, attribute) pairs, loaded by load_additional_tools
+_ADDITIONAL_TOOLS = (
+    ("handoff_to_user", "handoff_to_user"),
+    ("notebook", "notebook"),
+    ("str_replace_based_edit_tool", "str_replace_based_edit_tool"),
+)
+
+@contextlib.contextmanager
+def _buffered_log():
+    """
+    Collect log lines and write them to stdout in a single call on exit.
+    Loaders take an optional log list; without one they open a buffer of their own,
+    with one they only append and leave writing to the caller.
+    """
+    lines: list[str] = []
+    try:
+        yield lines
+    finally:
+        if lines:
+            sys.stdout.write("\n".join(lines) + "\n")
+            sys.stdout.flush()
+
+
+# StrandsTelemetry instance once setup_otel has configured the OTLP exporter
+_strands_telemetry = None
+
+
+@functools.lru_cache(maxsize=1)
+def _langfuse_auth(public_key: str, secret_key: str) -> str:
+    """Basic-auth token for the Langfuse OTEL endpoint."""
+    return base64.b64encode(public_key.encode() + b":" + secret_key.encode()).decode("ascii")
 
-def setup_otel() -> None:
+
+def setup_otel(log: list[str] | None = None) -> None:
     """Setup OpenTelemetry if configured."""
+    global _strands_telemetry
+
+    # Exporter already initialized in this process
+    if _strands_telemetry is not None:
+        return
+
+    if log is None:
+        with _buffered_log() as log:
+            return setup_otel(log)
+
     # Langfuse configuration
     langfuse_host = os.environ.get("LANGFUSE_BASE_URL")
     if langfuse_host:
@@ -29,91 +101,84 @@ def setup_otel() -> None:
         secret_key = os.environ.get("LANGFUSE_SECRET_KEY", "")
 
         if public_key and secret_key:
-            auth_token = base64.b64encode(f"{public_key}:{secret_key}".encode()).decode()
-            otel_endpoint = f"{langfuse_host}/api/public/otel"
-
-            os.environ["OTEL_EXPORTER_OTLP_ENDPOINT"] = otel_endpoint
-            os.environ["OTEL_EXPORTER_OTLP_HEADERS"] = f"Authorization=Basic {auth_token}"
-            print(f"✓ Langfuse OTEL: {langfuse_host}")
+            auth_token = _langfuse_auth(public_key, secret_key)
+
+            # Endpoint and auth are always set as a pair so spans never reach Langfuse with foreign credentials
+            os.environ.update(
+                {
+                    "OTEL_EXPORTER_OTLP_ENDPOINT": f"{langfuse_host}/api/public/otel",
+                    "OTEL_EXPORTER_OTLP_HEADERS": f"Authorization=Basic {auth_token}",
+                }
+            )
+            log.append(f"✓ Langfuse OTEL: {langfuse_host}")
 
     # Generic OTEL configuration
-    if os.environ.get("OTEL_EXPORTER_OTLP_ENDPOINT"):
-        try:
-            strands_telemetry = StrandsTelemetry()
-            strands_telemetry.setup_otlp_exporter()
-            print(f"✓ OTEL exporter: {os.environ.get('OTEL_EXPORTER_OTLP_ENDPOINT')}")
-        except Exception as e:
-            print(f"⚠ OTEL setup failed: {e}")
+    otel_endpoint = os.environ.get("OTEL_EXPORTER_OTLP_ENDPOINT")
+    if not otel_endpoint:
+        return
+
+    try:
+        from strands.telemetry import StrandsTelemetry
+
+        strands_telemetry = StrandsTelemetry()
+        strands_telemetry.setup_otlp_exporter()
+        _strands_telemetry = strands_telemetry
+        log.append(f"✓ OTEL exporter: {otel_endpoint}")
+    except Exception as e:
+        log.append(f"⚠ OTEL setup failed: {e}")
 
 
-def load_github_tools() -> list:
+def load_github_tools(log: list[str] | None = None) -> list:
     """Load GitHub tools from github_tools.py"""
+    if log is None:
+        with _buffered_log() as log:
+            return load_github_tools(log)
+
     try:
         import github_tools
-        github_tool_functions = [
-            github_tools.create_issue,
-            github_tools.update_issue,
-            github_tools.add_issue_comment,
-            github_tools.create_pull_request,
-            github_tools.update_pull_request,
-            github_tools.reply_to_review_comment,
-            github_tools.get_issue,
-            github_tools.list_issues,
-            github_tools.get_issue_comments,
-            github_tools.get_pull_request,
-            github_tools.list_pull_requests,
-            github_tools.get_pr_review_and_comments,
-        ]
-        print(f"✓ Loaded {len(github_tool_functions)} GitHub tools")
+
+        github_tool_functions = [getattr(github_tools, n) for n in _GITHUB_TOOL_NAMES]
+        log.append(f"✓ Loaded {len(github_tool_functions)} GitHub tools")
         return github_tool_functions
-    except ImportError as e:
-        print(f"✗ Failed to import github_tools: {e}")
+    except (ImportError, AttributeError) as e:
+        log.append(f"✗ Failed to import github_tools: {e}")
         return []
 
 
-def load_additional_tools() -> list:
+def load_additional_tools(log: list[str] | None = None) -> list:
     """Load additional tools: handoff_to_user, notebook, str_replace_based_edit_tool"""
+    if log is None:
+        with _buffered_log() as log:
+            return load_additional_tools(log)
+
     tools = []
-    
-    # Load handoff_to_user
-    try:
-        import handoff_to_user
-        tools.append(handoff_to_user.handoff_to_user)
-        print("✓ Loaded handoff_to_user tool")
-    except ImportError as e:
-        print(f"✗ Failed to import handoff_to_user: {e}")
-    
-    # Load notebook
-    try:
-        import notebook
-        tools.append(notebook.notebook)
-        print("✓ Loaded notebook tool")
-    except ImportError as e:
-        print(f"✗ Failed to import notebook: {e}")
-    
-    # Load str_replace_based_edit_tool
-    try:
-        import str_replace_based_edit_tool
-        tools.append(str_replace_based_edit_tool.str_replace_based_edit_tool)
-        print("✓ Loaded str_replace_based_edit_tool")
-    except ImportError as e:
-        print(f"✗ Failed to import str_replace_based_edit_tool: {e}")
-    
+
+    for module_name, attr in _ADDITIONAL_TOOLS:
+        # find_spec reports a missing module without raising ImportError
+        if importlib.util.find_spec(module_name) is None:
+            log.append(f"✗ Failed to import {module_name}: No module named '{module_name}'")
+            continue
+        try:
+            tools.append(getattr(importlib.import_module(module_name), attr))
+            log.append(f"✓ Loaded {attr} tool")
+        except (ImportError, AttributeError) as e:
+            log.append(f"✗ Failed to import {module_name}: {e}")
+
     if tools:
-        print(f"✓ Loaded {len(tools)} additional tools")
-    
+        log.append(f"✓ Loaded {len(tools)} additional tools")
+
     return tools
 
 
-def load_tools(config: str) -> list:
+def _parse_tools_config(config: str, log: list[str]) -> tuple:
     """
-    Load tools from config string.
+    Parse a tools config string into (package, (tool, ...)) pairs.
     Format: package1:tool1,tool2;package2:tool3,tool4
-    Examples:
-      - strands_tools:shell,editor;strands_action:use_github
-      - strands_action:use_github;strands_tools:shell,use_aws
+    Tool names for a package listed more than once are merged.
+    Invalid groups are reported on log.
     """
-    tools = []
+    # Group tool names by package so each package is imported once
+    package_groups: dict[str, list[str]] = {}
 
     # Split by semicolon to get package groups
     groups = config.split(";")
@@ -126,7 +191,7 @@ def load_tools(config: str) -> list:
         # Split by colon to get package:tools
         parts = group.split(":", 1)
         if len(parts) != 2:
-            print(f"✗ Invalid format: {group}")
+            log.append(f"✗ Invalid format: {group}")
             continue
 
         package = parts[0].strip()
@@ -134,85 +199,150 @@ def load_tools(config: str) -> list:
 
         # Parse tools (comma-separated)
         tool_names = [t.strip() for t in tools_str.split(",") if t.strip()]
+        package_groups.setdefault(package, []).extend(tool_names)
+
+    return tuple((package, tuple(tool_names)) for package, tool_names in package_groups.items() if tool_names)
+
+
+# The default config is well-formed, so nothing is logged
+_DEFAULT_PARSED = _parse_tools_config(_DEFAULT_TOOLS, [])
+
+
+def _load_parsed_tools(parsed: tuple, log: list[str] | None = None) -> list:
+    """Load tools from (package, (tool, ...)) pairs produced by _parse_tools_config."""
+    if log is None:
+        with _buffered_log() as log:
+            return _load_parsed_tools(parsed, log)
+
+    tools = []
+
+    for package, tool_names in parsed:
+        try:
+            module = _pkg_cache.get(package) or importlib.import_module(package)
+            _pkg_cache[package] = module
+        except ImportError:
+            # Import errors are reported per tool by the submodule fallback below
+            module = None
 
         for tool_name in tool_names:
             try:
-                module = __import__(package, fromlist=[tool_name])
-                tool = getattr(module, tool_name)
+                tool = getattr(module, tool_name, _MISSING)
+                if tool is _MISSING:
+                    # Tools may be submodules (e.g. strands_tools.shell) not imported by the package
+                    tool = importlib.import_module(f"{package}.{tool_name}")
                 tools.append(tool)
-                print(f"✓ {package}:{tool_name}")
+                log.append(f"✓ {package}:{tool_name}")
             except (ImportError, AttributeError) as e:
-                print(f"✗ {package}:{tool_name} - {e}")
+                log.append(f"✗ {package}:{tool_name} - {e}")
 
-    print(f"Loaded {len(tools)} tools")
+    log.append(f"Loaded {len(tools)} tools")
     return tools
 
 
-def load_mcp_servers() -> list:
+def load_tools(config: str, log: list[str] | None = None) -> list:
+    """
+    Load tools from config string.
+    Format: package1:tool1,tool2;package2:tool3,tool4
+    Examples:
+      - strands_tools:shell,editor;strands_action:use_github
+      - strands_action:use_github;strands_tools:shell,use_aws
+    """
+    if log is None:
+        with _buffered_log() as log:
+            return load_tools(config, log)
+
+    return _load_parsed_tools(_parse_tools_config(config, log), log)
+
+
+def _stdio_transport_factory(cfg: dict) -> Callable[[], Any]:
+    """Build the transport callable for a command-based (stdio) MCP server."""
+    from mcp import StdioServerParameters, stdio_client
+
+    params = StdioServerParameters(command=cfg["command"], args=cfg.get("args", []), env=cfg.get("env"))
+    return lambda: stdio_client(params)
+
+
+def _http_transport_factory(cfg: dict) -> Callable[[], Any]:
+    """Build the transport callable for a URL-based (SSE or streamable HTTP) MCP server."""
+    url = cfg["url"]
+    if "/sse" in url:
+        from mcp.client.sse import sse_client
+
+        return lambda: sse_client(url)
+
+    from mcp.client.streamable_http import streamablehttp_client
+
+    headers = cfg.get("headers")
+    return lambda: streamablehttp_client(url=url, headers=headers)
+
+
+# MCP server config key -> transport factory
+_TRANSPORTS = {
+    "command": _stdio_transport_factory,
+    "url": _http_transport_factory,
+}
+
+
+def load_mcp_servers(log: list[str] | None = None) -> list:
     """Load MCP servers from MCP_SERVERS env var with tool filtering."""
     mcp_json = os.getenv("MCP_SERVERS")
     if not mcp_json:
         return []
 
+    if log is None:
+        with _buffered_log() as log:
+            return load_mcp_servers(log)
+
     try:
-        from mcp import StdioServerParameters, stdio_client
-        from mcp.client.sse import sse_client
-        from mcp.client.streamable_http import streamablehttp_client
         from strands.tools.mcp import MCPClient
 
-        config = json.loads(mcp_json).get("mcpServers", {})
-        clients = []
-
-        for name, cfg in config.items():
-            try:
-                # Check if server is disabled
-                if cfg.get("disabled", False):
-                    print(f"⏭  MCP server '{name}' (disabled)")
-                    continue
-
-                # Get disabled tools list (for logging only - MCPClient handles filtering differently)
-                disabled_tools = cfg.get("disabledTools", [])
-
-                if "command" in cfg:
-                    command = cfg["command"]
-                    args = cfg.get("args", [])
-                    env = cfg.get("env")
-
-                    def transport(_cmd: str = command, _args: list = args, _env: dict | None = env):  # type: ignore[no-untyped-def]
-                        return stdio_client(StdioServerParameters(command=_cmd, args=_args, env=_env))
-
-                    client = MCPClient(
-                        transport_callable=transport,
-                        prefix=cfg.get("prefix", name),
-                    )
-                elif "url" in cfg:
-                    url = cfg["url"]
-                    headers = cfg.get("headers")
-
-                    def transport_http(_url: str = url, _headers: dict | None = headers):  # type: ignore[no-untyped-def]
-                        return sse_client(_url) if "/sse" in _url else streamablehttp_client(url=_url, headers=_headers)
-
-                    client = MCPClient(
-                        transport_callable=transport_http,
-                        prefix=cfg.get("prefix", name),
-                    )
-                else:
-                    continue
-
-                clients.append(client)
-
-                if disabled_tools:
-                    print(f"✓ MCP server '{name}' (disabled: {', '.join(disabled_tools)})")
-                else:
-                    print(f"✓ MCP server '{name}'")
-            except Exception as e:
-                print(f"✗ MCP server '{name}': {e}")
-
-        return clients
+        config = json_parser.loads(mcp_json).get("mcpServers", {})
+        if not isinstance(config, dict):
+            raise TypeError("mcpServers must be a JSON object")
     except Exception as e:
-        print(f"MCP loading failed: {e}")
+        log.append(f"MCP loading failed: {e}")
         return []
 
+    clients = []
+
+    for name, cfg in config.items():
+        try:
+            # Check if server is disabled
+            if cfg.get("disabled", False):
+                log.append(f"⏭  MCP server '{name}' (disabled)")
+                continue
+
+            # Get disabled tools list (for logging only - MCPClient handles filtering differently)
+            disabled_tools = cfg.get("disabledTools", [])
+
+            kind = "command" if "command" in cfg else "url" if "url" in cfg else None
+            if kind is None:
+                continue
+
+            client = MCPClient(
+                transport_callable=_TRANSPORTS[kind](cfg),
+                prefix=cfg.get("prefix", name),
+            )
+
+            clients.append(client)
+
+            if disabled_tools:
+                log.append(f"✓ MCP server '{name}' (disabled: {', '.join(disabled_tools)})")
+            else:
+                log.append(f"✓ MCP server '{name}'")
+        except Exception as e:
+            log.append(f"✗ MCP server '{name}': {e}")
+
+    return clients
+
+
+@functools.lru_cache(maxsize=4)
+def _build_prompt(base_prompt: str, github_context: str) -> str:
+    """Combine the base prompt with optional GitHub context."""
+    if not github_context:
+        return base_prompt
+    return "".join([base_prompt, "\n\nGitHub Context:\n```", github_context, "\n```"])
+
 
 def build_system_prompt() -> str:
     """Build system prompt from environment variables and context."""
@@ -222,58 +352,61 @@ def build_system_prompt() -> str:
         base_prompt = "You are an autonomous GitHub agent powered by Strands Agents SDK. (strands-agents/sdk-python)"
 
     # Add GitHub context if available
-    github_context = os.getenv("GITHUB_CONTEXT", "")
-    if github_context:
-        base_prompt = f"{base_prompt}\n\nGitHub Context:\n```{github_context}\n```"
+    return _build_prompt(base_prompt, os.getenv("GITHUB_CONTEXT", ""))
 
-    return base_prompt
+
+# Prompts shorter than this are skipped for KB retrieval (too little text for a useful embedding)
+_KB_MIN_PROMPT_CHARS = 16
 
 
 def run_agent(prompt: str) -> None:
     """Run the agent with the provided prompt."""
+    # Snapshot the environment once for the settings read directly below. Helpers such as
+    # load_mcp_servers and build_system_prompt still read os.environ, and setup_otel updates it.
+    env = os.environ.copy()
     has_mcp_servers = False
     try:
+        # Heavy SDK imports are deferred so --help and argument errors stay fast
+        from strands import Agent
+        from strands.session import S3SessionManager
+        from strands_tools.utils.models.model import create_model
+
         # Setup OpenTelemetry
         setup_otel()
 
         # Tool loading with defaults (minimal core tools)
-        default_tools = (
-            "strands_tools:shell,retrieve,use_agent;strands_action:use_github,system_prompt,store_in_kb,create_subagent"
-        )
-        tools_config = os.getenv("STRANDS_TOOLS", default_tools)
-
-        print(f"Loading tools: {tools_config}")
-        tools = load_tools(tools_config)
-
-        # Add GitHub tools
-        github_tools = load_github_tools()
-        tools.extend(github_tools)
-
-        # Add additional tools
-        additional_tools = load_additional_tools()
-        tools.extend(additional_tools)
+        tools_config = env.get("STRANDS_TOOLS")
+        load_mcp = env.get("STRANDS_LOAD_MCP_SERVERS", "true").lower() == "true"
+
+        # Loaders run sequentially and share one log buffer, written once in load order
+        with _buffered_log() as log:
+            if tools_config is None:
+                log.append(f"Loading tools: {_DEFAULT_TOOLS}")
+                base_tools = _load_parsed_tools(_DEFAULT_PARSED, log)
+            else:
+                log.append(f"Loading tools: {tools_config}")
+                base_tools = load_tools(tools_config, log)
+            github_tools = load_github_tools(log)
+            additional_tools = load_additional_tools(log)
+            mcp_servers = load_mcp_servers(log) if load_mcp else []
 
-        # MCP servers
-        if os.getenv("STRANDS_LOAD_MCP_SERVERS", "true").lower() == "true":
-            mcp_servers = load_mcp_servers()
-            if mcp_servers:
-                has_mcp_servers = True
-                tools.extend(mcp_servers)
+        has_mcp_servers = bool(mcp_servers)
+        tools = [*base_tools, *github_tools, *additional_tools, *mcp_servers]
 
         # Model and session
-        model = create_model(provider=os.getenv("STRANDS_PROVIDER", "bedrock"))
+        model = create_model(provider=env.get("STRANDS_PROVIDER", "bedrock"))
         session_id = (
-            os.getenv("SESSION_ID")
-            or f"gh-{os.getenv('GITHUB_REPOSITORY', 'unknown').replace('/', '-')}-{os.getenv('GITHUB_RUN_ID', 'local')}"
+            env.get("SESSION_ID")
+            or f"gh-{env.get('GITHUB_REPOSITORY', 'unknown').replace('/', '-')}-{env.get('GITHUB_RUN_ID', 'local')}"
         )
 
         session_manager = None
-        s3_bucket = os.getenv("S3_SESSION_BUCKET")
+        s3_bucket = env.get("S3_SESSION_BUCKET")
         if s3_bucket:
             session_manager = S3SessionManager(
                 session_id=session_id,
                 bucket=s3_bucket,
-                prefix=os.getenv("S3_SESSION_PREFIX", ""),
+                prefix=env.get("S3_SESSION_PREFIX", ""),
             )
             print(f"S3 session: {session_id}")
 
@@ -283,13 +416,13 @@ def run_agent(prompt: str) -> None:
             system_prompt=build_system_prompt(),
             tools=tools,
             session_manager=session_manager,
-            load_tools_from_directory=os.getenv("STRANDS_TOOLS_DIRECTORY", "false").lower() == "true",
+            load_tools_from_directory=env.get("STRANDS_TOOLS_DIRECTORY", "false").lower() == "true",
             trace_attributes={
                 "session.id": session_id,
-                "user.id": os.getenv("GITHUB_ACTOR", "unknown"),
-                "repository": os.getenv("GITHUB_REPOSITORY", "unknown"),
-                "workflow": os.getenv("GITHUB_WORKFLOW", "unknown"),
-                "run_id": os.getenv("GITHUB_RUN_ID", "unknown"),
+                "user.id": env.get("GITHUB_ACTOR", "unknown"),
+                "repository": env.get("GITHUB_REPOSITORY", "unknown"),
+                "workflow": env.get("GITHUB_WORKFLOW", "unknown"),
+                "run_id": env.get("GITHUB_RUN_ID", "unknown"),
                 "tags": ["Strands-Agents", "GitHub-Action"],
             },
         )
@@ -297,28 +430,36 @@ def run_agent(prompt: str) -> None:
         print(f"Agent created with {len(tools)} tools")
 
         # Knowledge base retrieval (before)
-        kb_id = os.getenv("STRANDS_KNOWLEDGE_BASE_ID")
+        kb_id = env.get("STRANDS_KNOWLEDGE_BASE_ID")
         if kb_id and "retrieve" in agent.tool_names:
-            try:
-                # Critical: `record_direct_tool_call=True` is mandatory. Do not remove.
-                agent.tool.retrieve(text=prompt, knowledgeBaseId=kb_id, record_direct_tool_call=True)
-                print(f"KB retrieval: {kb_id}")
-            except Exception as e:
-                print(f"KB retrieval failed: {e}")
+            if len(prompt.strip()) < _KB_MIN_PROMPT_CHARS:
+                print(f"KB retrieval skipped: prompt shorter than {_KB_MIN_PROMPT_CHARS} characters")
+            else:
+                try:
+                    # Critical: `record_direct_tool_call=True` is mandatory. Do not remove.
+                    agent.tool.retrieve(text=prompt, knowledgeBaseId=kb_id, record_direct_tool_call=True)
+                    print(f"KB retrieval: {kb_id}")
+                except Exception as e:
+                    print(f"KB retrieval failed: {e}")
 
         result = agent(prompt)
+        # Stringify once; the summary and KB storage below both reuse it
+        result_str = str(result)
 
         # Write to GitHub Actions summary
-        summary_file = os.getenv("GITHUB_STEP_SUMMARY")
+        summary_file = env.get("GITHUB_STEP_SUMMARY")
         if summary_file:
             try:
+                parts = [
+                    "## Agent\n\n",
+                    f"**Prompt:**\n```\n{prompt}\n```\n\n",
+                    f"**Result:**\n```\n{result_str}\n```\n\n",
+                    f"**Session:** `{session_id}`\n",
+                ]
+                if kb_id:
+                    parts.append(f"**Knowledge Base:** `{kb_id}`\n")
                 with open(summary_file, "a") as f:
-                    f.write("## Agent\n\n")
-                    f.write(f"**Prompt:**\n```\n{prompt}\n```\n\n")
-                    f.write(f"**Result:**\n```\n{str(result)}\n```\n\n")
-                    f.write(f"**Session:** `{session_id}`\n")
-                    if kb_id:
-                        f.write(f"**Knowledge Base:** `{kb_id}`\n")
+                    f.write("".join(parts))
             except Exception as e:
                 print(f"Failed to write summary: {e}")
 
@@ -326,7 +467,7 @@ def run_agent(prompt: str) -> None:
         if kb_id and "store_in_kb" in agent.tool_names:
             try:
                 agent.tool.store_in_kb(
-                    content=f"Input: {prompt}\nResult: {str(result)}",
+                    content=f"Input: {prompt}\nResult: {result_str}",
                     title=f"GitHub Agent: {prompt[:1000]}",
                     knowledge_base_id=kb_id,
                     record_direct_tool_call=False,
@@ -339,7 +480,7 @@ def run_agent(prompt: str) -> None:
 
         # Use os._exit() when MCP servers present (background threads need force-kill)
         # Unless PYTEST_CURRENT_TEST is set (testing mode), use sys.exit() for proper cleanup
-        if has_mcp_servers and not os.getenv("PYTEST_CURRENT_TEST"):
+        if has_mcp_servers and not env.get("PYTEST_CURRENT_TEST"):
             os._exit(0)
         else:
             sys.exit(0)
@@ -349,7 +490,7 @@ def run_agent(prompt: str) -> None:
 
         # Use os._exit() when MCP servers present (background threads need force-kill)
         # Unless PYTEST_CURRENT_TEST is set (testing mode), use sys.exit() for proper cleanup
-        if "has_mcp_servers" in locals() and has_mcp_servers and not os.getenv("PYTEST_CURRENT_TEST"):
+        if "has_mcp_servers" in locals() and has_mcp_servers and not env.get("PYTEST_CURRENT_TEST"):
             os._exit(1)
         else:
             sys.exit(1)
@@ -357,6 +498,12 @@ def run_agent(prompt: str) -> None:
 
 def main() -> None:
     """Main entry point."""
+    # Fast path for GitHub Actions: prompt from env var and no CLI args, so argparse is not needed
+    prompt = os.getenv("STRANDS_PROMPT")
+    if prompt and prompt.strip() and not sys.argv[1:]:
+        run_agent(prompt)
+        return
+
     import argparse
 
     parser = argparse.ArgumentParser(